@@ -1,5 +1,7 @@
 from __future__ import annotations
+import sys
 import struct
+from functools import lru_cache
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -46,6 +48,65 @@ ContentType = (
 )
 
 
+def _crc16_ccitt_table() -> tuple[int, ...]:
+    """
+    Build the lookup table for the crc16-CCITT/XMODEM algorithm.
+
+    Returns
+    -------
+    tuple of int
+        crc values for all 256 byte values.
+    """
+    table = []
+    for byte in range(256):
+        crc = byte << 8
+        for _ in range(8):
+            crc <<= 1
+            if crc & 0x10000:
+                crc ^= 0x1021
+        table.append(crc & 0xffff)
+    return tuple(table)
+
+
+_CRC16_CCITT_TABLE = _crc16_ccitt_table()
+
+
+@lru_cache(maxsize=256)
+def _compiled(fmt: str) -> struct.Struct:
+    """
+    Get compiled struct for the specified format.
+
+    Parameters
+    ----------
+    fmt: str
+        format for packing or unpacking the content.
+
+    Returns
+    -------
+    struct.Struct
+        compiled struct, cached per format.
+    """
+    return struct.Struct(fmt)
+
+
+@lru_cache(maxsize=256)
+def _fmt_info(fmt: str) -> tuple[int, np.dtype]:
+    """
+    Get the word size and numpy dtype for the specified format.
+
+    Parameters
+    ----------
+    fmt: str
+        format for packing or unpacking the content.
+
+    Returns
+    -------
+    tuple of {int, numpy.dtype}
+        word size in bytes and dtype, cached per format.
+    """
+    return _compiled(fmt).size, np.dtype(fmt)
+
+
 class BaseField(object):  # todo: unique parameter
     """
     Represents a basic class for single field with all required properties.
@@ -72,6 +133,11 @@ class BaseField(object):  # todo: unique parameter
         parent message.
     """
 
+    __slots__ = (
+        "_mf_name", "_name", "_exp", "_finite", "_may_be_empty", "_fmt",
+        "_bytesize", "_np_dtype", "_content", "_def", "_parent", "_slice",
+    )
+
     def __init__(
             self,
             mf_name: str,
@@ -85,17 +151,21 @@ class BaseField(object):  # todo: unique parameter
             default: bytes,
             parent: FieldMessage,
     ):
-        self._mf_name = mf_name
-        self._name = name
+        self._mf_name = sys.intern(mf_name)
+        self._name = sys.intern(name)
         self._exp = expected
+        self._finite = expected > 0
         self._may_be_empty = may_be_empty
         self._fmt = fmt
+        # The Struct itself is not stored on the field: messages are
+        # copied via deepcopy in split and Struct cannot be pickled.
+        self._bytesize, self._np_dtype = _fmt_info(fmt)
         self._content = content
         self._def = default
         self._parent = parent
 
-        if self.finite:
-            stop_byte = start_byte + self.bytesize * expected
+        if self._finite:
+            stop_byte = start_byte + self._bytesize * expected
         else:
             stop_byte = None
         self._slice = slice(start_byte, stop_byte)
@@ -103,7 +173,7 @@ class BaseField(object):  # todo: unique parameter
     @property
     def bytesize(self) -> int:
         """The length of the one word in bytes."""
-        return struct.calcsize(self._fmt)
+        return self._bytesize
 
     @property
     def content(self) -> bytes:
@@ -122,7 +192,7 @@ class BaseField(object):  # todo: unique parameter
 
     @property
     def finite(self):
-        return self._exp > 0
+        return self._finite
 
     @property
     def fmt(self) -> str:
@@ -170,13 +240,16 @@ class BaseField(object):  # todo: unique parameter
 
     @stop_byte.setter
     def stop_byte(self, stop: int | None) -> None:
-        """Set the numbet of a stop byte of a field in a message."""
-        self._slice = slice(self._slice.start, stop)
+        """Set the numbet of a stop byte of a field in a message.
+
+        Zero is normalized to None (open end of a message).
+        """
+        self._slice = slice(self._slice.start, stop or None)
 
     @property
     def words_count(self) -> int:
         """The length of the field in words."""
-        return len(self._content) // self.bytesize
+        return len(self._content) // self._bytesize
 
 
 class Field(BaseField):
@@ -209,6 +282,8 @@ class Field(BaseField):
     FieldBase: parent class.
     """
 
+    __slots__ = ()
+
     def __init__(
             self,
             mf_name: str,
@@ -279,7 +354,7 @@ class Field(BaseField):
             raise ValueError(
                 "Unable to extract because the incoming message is empty"
             )
-        self.set(message[self._slice])
+        self.set(memoryview(message)[self._slice])
 
     def reset_to_default(self) -> None:
         """Set field content to default."""
@@ -302,6 +377,14 @@ class Field(BaseField):
         --------
         _validate_content: method of validating new content.
         """
+        if type(content) is bytes:
+            length = len(content)
+            if length and length % self._bytesize == 0 and (
+                    not self._finite
+                    or length == self._exp * self._bytesize
+            ):
+                self._content = content
+                return
         self._content = self._validate_content(self._convert_content(content))
 
     def unpack(self, fmt: str = None) -> npt.NDArray:
@@ -356,10 +439,13 @@ class Field(BaseField):
         """
 
         if isinstance(content, np.ndarray):
-            converted = content.astype(self._fmt).tobytes()
-        elif not isinstance(content, bytes | bytearray) \
+            converted = content.astype(self._np_dtype, copy=False).tobytes()
+        elif isinstance(content, int | np.integer) \
+                and self._np_dtype.kind in "ui":
+            converted = _compiled(self._fmt).pack(content)
+        elif not isinstance(content, bytes | bytearray | memoryview) \
                 and isinstance(content, Iterable | np.number | int | float):
-            converted = np.array(content, dtype=self._fmt).tobytes()
+            converted = np.array(content, dtype=self._np_dtype).tobytes()
         else:
             converted = bytes(content)
 
@@ -384,7 +470,7 @@ class Field(BaseField):
             an array of unpacked bytes.
         """
         if fmt is None:
-            fmt = self._fmt
+            return np.frombuffer(bytes_, dtype=self._np_dtype)
         return np.frombuffer(bytes_, dtype=fmt)
 
     def _validate_content(
@@ -420,8 +506,9 @@ class Field(BaseField):
         if exp is None:
             exp = self._exp
 
-        if len(content) % self.bytesize != 0:
-            words_count = len(content) / self.bytesize
+        length, bytesize = len(content), self._bytesize
+        if length % bytesize != 0:
+            words_count = length / bytesize
             raise FieldContentError(
                 self.__class__,
                 exp,
@@ -434,8 +521,8 @@ class Field(BaseField):
 
         # Similary to self._exp > 0
         # and (len(content) / self._word_bsize) != self._exp
-        if 0 < exp != len(content) / self.bytesize:
-            fill_ratio = len(content) / (exp * self.bytesize)
+        if 0 < exp != length // bytesize:
+            fill_ratio = length / (exp * bytesize)
             raise FieldContentError(
                 self.__class__,
                 fill_ratio,
@@ -496,19 +583,35 @@ class Field(BaseField):
         """
         if not len(self._content):
             return "EMPTY"
+        return self._hex_words(self._content)
 
-        words = []
-        for start in range(0, len(self.content), self.bytesize):
-            word = self.content[start:start + self.bytesize] \
-                .hex().lstrip("0")
-            words.append(word.upper() if len(word) else "0")
-        return " ".join(words)
+    def _hex_words(self, content: bytes) -> str:
+        """
+        Convert content to a string of space-separated hexadecimal words.
+
+        Parameters
+        ----------
+        content: bytes
+            content for converting.
+
+        Returns
+        -------
+        str
+            words in hexadecimal format without leading zeros.
+        """
+        hex_ = content.hex()
+        step = self._bytesize * 2
+        return " ".join(
+            hex_[start:start + step].lstrip("0").upper() or "0"
+            for start in range(0, len(hex_), step)
+        )
 
     def __repr__(self) -> str:
         """Returns string representation of the field instance"""
         if self.words_count > 16:
             self_str = "{} ...({})".format(
-                " ".join(str(self).split(" ")[:8]), self.words_count - 8
+                self._hex_words(self._content[:self._bytesize * 8]),
+                self.words_count - 8,
             )
         else:
             self_str = str(self)
@@ -545,6 +648,8 @@ class SingleField(Field):
     Field: parent class.
     """
 
+    __slots__ = ()
+
     def __init__(
             self,
             mf_name: str,
@@ -575,6 +680,28 @@ class SingleField(Field):
             may_be_empty=self._may_be_empty,
         )
 
+    def _unpack_word(self) -> int | float:
+        """
+        Unpack the single-word content.
+
+        Integer formats go through int.from_bytes, which skips the
+        numpy array allocation in the unpack method; other formats
+        fall back to it.
+
+        Returns
+        -------
+        int or float
+            unpacked word.
+        """
+        kind, order = self._np_dtype.kind, self._np_dtype.byteorder
+        if kind in "ui" and (order in "><" or self._bytesize == 1):
+            return int.from_bytes(
+                self._content,
+                "little" if order == "<" else "big",
+                signed=kind == "i",
+            )
+        return self.unpack()[0]
+
 
 class StaticField(SingleField):
     """
@@ -605,6 +732,8 @@ class StaticField(SingleField):
     FieldSingle: parent class.
     """
 
+    __slots__ = ("_content_hash",)
+
     def __init__(
             self,
             mf_name: str,
@@ -625,6 +754,7 @@ class StaticField(SingleField):
             may_be_empty=False,
             parent=parent,
         )
+        self._content_hash = hash(self._content)
 
     def get_setter(self) -> FieldSetter:
         return FieldSetter.static(
@@ -635,13 +765,17 @@ class StaticField(SingleField):
         content = self._convert_content(content)
         if content == b"":
             pass
-        elif self._content != b"" and content != self._content:
+        elif self._content != b"" and (
+                hash(content) != self._content_hash
+                or content != self._content
+        ):
             raise ValueError(
                 "The current content of the static field is different from "
                 "the new content: %r != %r" % (self._content, content)
             )
         else:
             super().set(content)
+            self._content_hash = hash(self._content)
 
 
 class AddressField(SingleField):
@@ -669,6 +803,8 @@ class AddressField(SingleField):
     FieldSingle: parent class.
     """
 
+    __slots__ = ()
+
     def __init__(
             self,
             mf_name: str,
@@ -724,6 +860,8 @@ class CrcField(SingleField):
     FieldSingle: parent class.
     """
 
+    __slots__ = ("_wo_fields", "_alg_name", "_alg")
+
     def __init__(
             self,
             mf_name: str,
@@ -768,11 +906,11 @@ class CrcField(SingleField):
         int
             crc value.
         """
-        content = b""
-        for field in msg:
-            if field.name not in self._wo_fields \
-                    and not isinstance(field, CrcField):
-                content += field.content
+        content = b"".join(
+            field.content for field in msg
+            if field.name not in self._wo_fields
+            and not isinstance(field, CrcField)
+        )
         return self._alg(content)
 
     def get_setter(self) -> FieldSetter:
@@ -801,14 +939,9 @@ class CrcField(SingleField):
             crc value from 0 to 0xffff.
         """
 
-        crc, poly = 0, 0x1021
-        for idx in range(len(content)):
-            crc ^= content[idx] << 8
-            for _ in range(8):
-                crc <<= 1
-                if crc & 0x10000:
-                    crc ^= poly
-            crc &= 0xffff
+        crc, table = 0, _CRC16_CCITT_TABLE
+        for byte in content:
+            crc = ((crc << 8) & 0xffff) ^ table[(crc >> 8) ^ byte]
         return crc
 
     CRC_ALGORITHMS: dict[str, Callable[[bytes], int]] = {
@@ -869,6 +1002,8 @@ class DataField(Field):
     Field: parent class.
     """
 
+    __slots__ = ()
+
     def __init__(
             self,
             mf_name: str,
@@ -942,6 +1077,8 @@ class DataLengthField(SingleField):
     SingleField: parent class.
     """
 
+    __slots__ = ("_bvr", "_units", "_add")
+
     def __init__(
             self,
             mf_name: str,
@@ -1004,12 +1141,13 @@ class DataLengthField(SingleField):
             if units not in {BYTES, WORDS}.
         """
 
-        if self._units is Code.BYTES:
+        units = self._units
+        if units is Code.BYTES:
             return len(data) + self._add
-        elif self._units is Code.WORDS:
+        elif units is Code.WORDS:
             return data.words_count + self._add
         else:
-            raise ValueError(f"invalid units: {self._units}")
+            raise ValueError(f"invalid units: {units}")
 
     def get_setter(self) -> FieldSetter:
         return FieldSetter.data_length(
@@ -1073,6 +1211,8 @@ class IdField(SingleField):
         parent message.
     """
 
+    __slots__ = ()
+
     def __init__(
             self,
             mf_name: str,
@@ -1172,6 +1312,8 @@ class OperationField(SingleField):
     FieldSingle: parent class.
     """
 
+    __slots__ = ("_desc_dict", "_desc_dict_r", "_desc_arr", "_desc")
+
     READ = "r"  # todo: to codes
     WRITE = "w"
     ERROR = "e"
@@ -1193,6 +1335,17 @@ class OperationField(SingleField):
             self._desc_dict = desc_dict
         self._desc_dict_r = {v: k for k, v in self._desc_dict.items()}
 
+        codes = self._desc_dict_r
+        if len(codes) and all(
+                isinstance(c, int) and 0 <= c < 16 for c in codes
+        ):
+            arr: list[str | None] = [None] * (max(codes) + 1)
+            for code, desc in codes.items():
+                arr[code] = desc
+            self._desc_arr: tuple[str | None, ...] | None = tuple(arr)
+        else:
+            self._desc_arr = None
+
         SingleField.__init__(
             self,
             mf_name,
@@ -1211,14 +1364,16 @@ class OperationField(SingleField):
 
     def update_desc(self) -> None:
         """Update desc by desc dict where key is a content value."""
-        c_value = self.unpack()
-        if len(c_value):
-            if c_value[0] in self.desc_dict_r:
-                self._desc = self._desc_dict_r[c_value[0]]
-            else:
-                self._desc = "unknown"
-        else:
+        if not len(self._content):
             self._desc = ""
+            return
+
+        code, arr = self._unpack_word(), self._desc_arr
+        if arr is not None and isinstance(code, int | np.integer):
+            desc = arr[code] if 0 <= code < len(arr) else None
+        else:
+            desc = self._desc_dict_r.get(code)
+        self._desc = desc if desc is not None else "unknown"
 
     def compare(self, other) -> bool:
         """
@@ -1239,6 +1394,8 @@ class OperationField(SingleField):
         TypeError:
             if other is not instanse string, FieldOperation or MessageType.
         """
+        if other is self:
+            return True
         if isinstance(other, str):
             base = other[0]
         elif isinstance(other, OperationField):
@@ -1347,6 +1504,8 @@ class ResponseField(SingleField):
     SingleField: parent class.
     """
 
+    __slots__ = ("_codes", "_def_code", "_code_table")
+
     OK = Code.OK
     "all is OK"
 
@@ -1388,6 +1547,18 @@ class ResponseField(SingleField):
             default_code = Code(default_code)
         self._def_code = default_code
 
+        codes_ = self._codes
+        if len(codes_) and all(
+                isinstance(v, int | np.integer) and 0 <= v < 64
+                for v in codes_
+        ):
+            table: list[Code | None] = [None] * (max(codes_) + 1)
+            for val, code in codes_.items():
+                table[val] = code
+            self._code_table: tuple[Code | None, ...] | None = tuple(table)
+        else:
+            self._code_table = None
+
     def get_setter(self) -> FieldSetter:
         return FieldSetter.response(
             fmt=self._fmt, codes=self._codes, default_code=self._def_code,
@@ -1418,9 +1589,13 @@ class ResponseField(SingleField):
             if unknown value and default code is None.
         """
         if len(self):
-            val = self.unpack()[0]
-            if val in self._codes:
-                return self._codes[val]
+            val, table = self._unpack_word(), self._code_table
+            if table is not None and isinstance(val, int | np.integer):
+                code = table[val] if 0 <= val < len(table) else None
+            else:
+                code = self._codes.get(val)
+            if code is not None:
+                return code
             elif self._def_code is not None:
                 return self._def_code
             raise FieldContentError(
@@ -1452,6 +1627,8 @@ class ResponseField(SingleField):
 
 class FieldSetter(object):
 
+    __slots__ = ("field_type", "kwargs", "_field_class")
+
     FIELD_TYPES = dict(
         single=SingleField,
         static=StaticField,
@@ -1477,6 +1654,7 @@ class FieldSetter(object):
                 )
             )
         self.kwargs = kwargs
+        self._field_class = self.FIELD_TYPES.get(field_type, Field)
 
     def get_field_class(self) -> type[FieldType]:  # todo: tests
         """
@@ -1485,12 +1663,15 @@ class FieldSetter(object):
         If `field_type` is None or another non-existent field type name -
         Field class is returned.
 
+        The class is resolved once at initialization, so the configure
+        hot path reads an attribute instead of probing the types dict.
+
         Returns
         -------
         type[FieldType]
             field class instance.
         """
-        return self.FIELD_TYPES.get(self.field_type, Field)
+        return self._field_class
 
     @classmethod
     def base(
@@ -323,6 +323,12 @@ class FieldMessage(object):
         self._src, self._dst = None, None
         self._fields: dict[str, FieldType] = {}
         self._field_types: dict[type[FieldType], str] = {}
+        self._data_f: DataField | None = None
+        self._dlen_f: DataLengthField | None = None
+        self._crc_f: CrcField | None = None
+        self._oper_f: OperationField | None = None
+        self._get_parser: MessageFieldsGetParser | None = None
+        self._has_parser: MessageFieldsHasParser | None = None
 
     def clear_src_dst(self) -> None:
         """Set `src` and `dst` to None."""
@@ -356,6 +362,7 @@ class FieldMessage(object):
             )
 
         self._fields = {n: self._get_field(n, s) for n, s in fields.items()}
+        self._get_parser = self._has_parser = None
 
         infinite_exists = False  # todo: create _validate_fields
         for field in self:
@@ -372,6 +379,16 @@ class FieldMessage(object):
         for field in self:
             if field.__class__ not in self._field_types:
                 self._field_types[field.__class__] = field.name
+
+        def first_of(type_: type[FieldType]) -> FieldType | None:
+            name = self._field_types.get(type_)
+            return None if name is None else self._fields[name]
+
+        self._data_f = first_of(DataField)
+        self._dlen_f = first_of(DataLengthField)
+        self._crc_f = first_of(CrcField)
+        self._oper_f = first_of(OperationField)
+
         self._set_field_ranges()
         return self
 
@@ -472,15 +489,11 @@ class FieldMessage(object):
         for name, content in fields.items():
             self[name].set(content)
 
-        if self.has.DataLengthField:
-            data_length = self.get.DataLengthField
-            if data_length.name not in fields:
-                data_length.update()
+        if self._dlen_f is not None and self._dlen_f.name not in fields:
+            self._dlen_f.update()
 
-        if self.has.CrcField:
-            crc = self.get.CrcField
-            if crc.name not in fields:
-                crc.update()
+        if self._crc_f is not None and self._crc_f.name not in fields:
+            self._crc_f.update()
 
         self._validate_content()
         return self
@@ -565,10 +578,15 @@ class FieldMessage(object):
         numpy.typing.NDArray
             unpacked message content.
         """
-        unpacked = np.array([])  # todo: create array with required length
-        for field in self:
-            unpacked = np.append(unpacked, field.unpack())
-        return unpacked
+        fields = tuple(self._fields.values())
+        if not len(fields):
+            return np.array([])
+        fmt = fields[0].fmt
+        if all(field.fmt == fmt for field in fields):
+            return np.frombuffer(
+                b"".join(field.content for field in fields), dtype=fmt
+            )
+        return np.concatenate([field.unpack() for field in fields])
 
     def _content_repr(self) -> str:
         """
@@ -611,13 +629,14 @@ class FieldMessage(object):
     def _set_field_ranges(self) -> None:
         """Set fields start and stop bytes."""
         fields: list[FieldType] = list(self)
+        layout = [(f, f.expected * f.bytesize, f.finite) for f in fields]
         i_infinite, next_start_byte = -1, 0
-        for i_field, field in enumerate(fields):
+        for i_field, (field, length, finite) in enumerate(layout):
 
             field.start_byte = next_start_byte
-            next_start_byte += field.expected * field.bytesize
+            next_start_byte += length
 
-            if field.finite:
+            if finite:
                 field.stop_byte = next_start_byte
             elif i_field == len(fields) - 1:
                 field.stop_byte = None
@@ -630,14 +649,11 @@ class FieldMessage(object):
             return
 
         next_start_byte = 0
-        for i_field, field in enumerate(fields[::-1]):
+        for field, length, finite in reversed(layout):
 
-            if field.finite:
-                if next_start_byte:
-                    field.stop_byte = next_start_byte
-                else:
-                    field.stop_byte = None
-                next_start_byte -= field.expected * field.bytesize
+            if finite:
+                field.stop_byte = next_start_byte
+                next_start_byte -= length
                 field.start_byte = next_start_byte
 
             else:
@@ -656,9 +672,8 @@ class FieldMessage(object):
                     self.__class__.__name__, field.name, "field is empty"
                 )
 
-        if self.has.OperationField and self.has.DataLengthField:
-            operation = self.get.OperationField
-            data_length = self.get.DataLengthField
+        if self._oper_f is not None and self._dlen_f is not None:
+            operation, data_length = self._oper_f, self._dlen_f
 
             if operation.base == "w" and (
                     not self.data.may_be_empty or self.data.words_count
@@ -669,8 +684,8 @@ class FieldMessage(object):
                     "invalid length"
                 )
 
-        if self.has.CrcField:
-            crc = self.get.CrcField
+        if self._crc_f is not None:
+            crc = self._crc_f
             res_crc, ref_crc = crc.calculate(self), crc[0]
             if ref_crc != res_crc:
                 raise MessageContentError(
@@ -687,6 +702,8 @@ class FieldMessage(object):
         DataField
             data field instance.
         """
+        if self._data_f is not None:
+            return self._data_f
         return self.get.DataField
 
     @property
@@ -719,7 +736,11 @@ class FieldMessage(object):
         MessageFieldsGetParser
             parser for getting fields instance.
         """
-        return MessageFieldsGetParser(self._fields, self._field_types)
+        if self._get_parser is None:
+            self._get_parser = MessageFieldsGetParser(
+                self._fields, self._field_types
+            )
+        return self._get_parser
 
     @property
     def has(self) -> MessageFieldsHasParser:
@@ -729,7 +750,11 @@ class FieldMessage(object):
         MessageFieldsHasParser
             parser to check the parameters of the fields in the message.
         """
-        return MessageFieldsHasParser(self._fields, self._field_types)
+        if self._has_parser is None:
+            self._has_parser = MessageFieldsHasParser(
+                self._fields, self._field_types
+            )
+        return self._has_parser
 
     @property
     def mf_name(self) -> str:
@@ -1026,7 +1051,7 @@ MessageType = (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class MessageSetter(object):
     """
     Represent setter, which contain keyword arguments for setting message.
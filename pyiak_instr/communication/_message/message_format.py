@@ -1,5 +1,6 @@
 from __future__ import annotations
 from copy import deepcopy
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -9,6 +10,7 @@ from ...core import Code
 from ...rwfile import (
     RWConfig,
 )
+from ...utilities import StringEncoder
 
 
 __all__ = [
@@ -56,6 +58,8 @@ class AsymmetricResponseField(object):  # todo: add to fields
         if `value` type is not bytes.
     """
 
+    __slots__ = ("_oper", "_val", "_slice")
+
     def __init__(
             self,
             operand: str = "",
@@ -264,6 +268,7 @@ class MessageFormat(object):
         self._arf = arf
         self._msg_set = message_setter
         self._setters = setters
+        self._init_kw: dict[str, Any] | None = None
 
         setters_diff = set(
             self._msg_set.message_class.REQUIRED_FIELDS
@@ -281,10 +286,12 @@ class MessageFormat(object):
             path to the config file.
         """
         with RWConfig(config) as rwc:
-            if self._msg_set.mf_name in rwc.hapi.sections():
-                rwc.hapi.remove_section(self._msg_set.mf_name)
-            rwc.apply_changes()  # todo: test to correct work (replace section)
-            rwc.write(self._msg_set.mf_name, self.init_kwargs)
+            sections = rwc.read_all(convert=False)
+            sections[self._msg_set.mf_name] = {
+                opt: StringEncoder.to_str(val)
+                for opt, val in self.init_kwargs.items()
+            }
+            rwc.bulk_write(sections, convert=False)
 
     def get(self, **update: dict[str, Any]) -> MessageType:
         """
@@ -302,7 +309,10 @@ class MessageFormat(object):
         MessageType
             message configured with message format.
         """
-        setters = deepcopy(self._setters)
+        setters = {
+            name: FieldSetter(setter.field_type, **setter.kwargs)
+            for name, setter in self._setters.items()
+        }
         if len(update):
             for setter_name, fields in update.items():
                 setters[setter_name].kwargs.update(fields)
@@ -330,13 +340,50 @@ class MessageFormat(object):
         ValueError
             if config does now have required message format.
         """
-        kw = {}
+        config = Path(config).resolve()
+        stat = config.stat()
+        return deepcopy(cls._read_cached(
+            config, stat.st_mtime_ns, stat.st_size, mf_name
+        ))
+
+    @classmethod
+    @lru_cache(maxsize=128)
+    def _read_cached(
+            cls, config: Path, mtime_ns: int, size: int, mf_name: str
+    ) -> MessageFormat:
+        """
+        Read message format from a config with memoization.
+
+        Cached per config path, file modification time and format name,
+        so repeated loads from an unchanged file are parsed only once.
+        The `read` method returns a deep copy of the cached instance.
+
+        Parameters
+        ----------
+        config: Path
+            resolved path to the config file.
+        mtime_ns: int
+            modification time of the config file in nanoseconds.
+        size: int
+            size of the config file in bytes.
+        mf_name: str
+            name of message format.
+
+        Returns
+        -------
+        MessageFormat
+            message format initialized with parameters from the config.
+
+        Raises
+        ------
+        ValueError
+            if config does now have required message format.
+        """
         with RWConfig(config) as rwc:
-            if mf_name not in rwc.hapi.sections():
-                raise ValueError("format with name %r not exists" % mf_name)
-            kw = {opt: rwc.get(mf_name, opt)
-                  for opt in rwc.hapi.options(mf_name)}
-        return cls(**kw)
+            sections = rwc.read_all()
+        if mf_name not in sections:
+            raise ValueError("format with name %r not exists" % mf_name)
+        return cls(**sections[mf_name])
 
     @property
     def arf(self) -> AsymmetricResponseField:
@@ -351,16 +398,24 @@ class MessageFormat(object):
     @property
     def init_kwargs(self) -> dict[str, Any]:
         """
+        Computed on first access and cached: the message setter, arf and
+        field setters are fixed at initialization.
+
         Returns
         -------
         dict[str, Any]
             dictionary with all required arguments for init method.
         """
-        return dict(
-            message_setter=self._msg_set.init_kwargs,
-            arf=self.arf.kwargs,
-            **{n: s.init_kwargs for n, s in self._setters.items()}
-        )
+        if self._init_kw is None:
+            init_kw: dict[str, Any] = dict(
+                message_setter=self._msg_set.init_kwargs,
+                arf=self.arf.kwargs,
+            )
+            init_kw.update(
+                (n, s.init_kwargs) for n, s in self._setters.items()
+            )
+            self._init_kw = init_kw
+        return self._init_kw
 
     @property
     def message_setter(self) -> MessageSetter:
@@ -430,8 +485,14 @@ class MessageFormatMap(object):
         config: Path
             path to config file.
         """
-        for mf in self._formats.values():
-            mf.write(config)
+        with RWConfig(config) as rwc:
+            sections = rwc.read_all(convert=False)
+            for mf_name, mf in self._formats.items():
+                sections[mf_name] = {
+                    opt: StringEncoder.to_str(val)
+                    for opt, val in mf.init_kwargs.items()
+                }
+            rwc.bulk_write(sections, convert=False)
 
     @classmethod
     def read(cls, config: Path) -> MessageFormatMap:
@@ -449,8 +510,8 @@ class MessageFormatMap(object):
             class instance with formats from config.
         """
         with RWConfig(config) as rwc:
-            formats = rwc.hapi.sections()
-        return cls(*(MessageFormat.read(config, f) for f in formats))
+            sections = rwc.read_all()
+        return cls(*(MessageFormat(**kw) for kw in sections.values()))
 
     @property
     def formats(self) -> dict[str, MessageFormat]:
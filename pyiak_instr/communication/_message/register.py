@@ -501,11 +501,18 @@ class RegisterMap(object):
                     "registers",
                     rws.connection,
                     index=False,
-                    if_exists=if_exists
+                    if_exists=if_exists,
+                    method="multi",
+                    chunksize=500,
                 )
             return
         self._tbl.to_sql(
-            "registers", database, index=False, if_exists=if_exists
+            "registers",
+            database,
+            index=False,
+            if_exists=if_exists,
+            method="multi",
+            chunksize=500,
         )
 
     def _validate_table(self, table: pd.DataFrame) -> pd.DataFrame:
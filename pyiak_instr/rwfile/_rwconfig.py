@@ -1,4 +1,5 @@
 import io
+import re
 import configparser
 from pathlib import Path
 from typing import overload, Any
@@ -22,13 +23,24 @@ class RWConfig(RWFile):
         path to config file *.ini.
     """
 
-    _hapi: configparser.ConfigParser
+    _hapi: configparser.ConfigParser | None
 
     FILE_SUFFIXES = {".ini"}
 
+    SECTION_PATTERN = re.compile(r"^\[([^]]+)]$", re.MULTILINE)
+    "pattern of a section line in the configfile."
+
+    OPTION_PATTERN = re.compile(
+        r"^([^\s\[;#][^=]*?)\s*=\s*(.*)$", re.MULTILINE
+    )
+    "pattern of an option line in the configfile."
+
     def __init__(self, filepath: Path | str):
         super().__init__(filepath)
-        self._hapi = self._read_config()
+        if not self._fp.exists():
+            with io.open(self._fp, 'w') as cfg_file:
+                configparser.ConfigParser().write(cfg_file)
+        self._hapi = None
 
     def apply_changes(self) -> None:
         """
@@ -37,7 +49,7 @@ class RWConfig(RWFile):
         Used for save changes which created by .set method.
         """
         with io.open(self._fp, 'w') as cfg_file:
-            self._hapi.write(cfg_file)
+            self.hapi.write(cfg_file)
 
     def close(self):
         pass
@@ -66,7 +78,7 @@ class RWConfig(RWFile):
         Any
             resulting value from configfile.
         """
-        value = self._hapi.get(section, option)
+        value = self.hapi.get(section, option)
         if convert:
             return StringEncoder.from_str(value)
         return value
@@ -121,7 +133,77 @@ class RWConfig(RWFile):
         """
         if convert:
             value = StringEncoder.to_str(value)
-        self._hapi.set(section, option, value)
+        self.hapi.set(section, option, value)
+
+    def read_all(self, convert: bool = True) -> dict[str, dict[str, Any]]:
+        """
+        Read all sections and options from the configfile in one pass.
+
+        Parses the file with `SECTION_PATTERN` and `OPTION_PATTERN`
+        instead of the configparser, which is noticeably faster for
+        the simple 'option = value' layout written by this class.
+
+        Parameters
+        ----------
+        convert: bool
+            convert the resulting values from str by StringEncoder.
+
+        Returns
+        -------
+        dict of {str: {str: Any}}
+            configfile content in format {section: {option: value}}.
+        """
+        text = self._fp.read_text() if self._fp.exists() else ""
+        sections = {}
+        matches = tuple(self.SECTION_PATTERN.finditer(text))
+        from_str, finditer = StringEncoder.from_str, (
+            self.OPTION_PATTERN.finditer
+        )
+        for i_sec, sec in enumerate(matches):
+            if i_sec + 1 < len(matches):
+                stop = matches[i_sec + 1].start()
+            else:
+                stop = len(text)
+
+            options = {}
+            for opt in finditer(text, sec.end(), stop):
+                value = opt.group(2)
+                options[opt.group(1).lower()] = (
+                    from_str(value) if convert else value
+                )
+            sections[sec.group(1)] = options
+        return sections
+
+    def bulk_write(
+            self, sections: dict[str, dict[str, Any]], convert: bool = True
+    ) -> None:
+        """
+        Write all sections to the configfile in one pass.
+
+        Composes the whole file text in memory and writes it with a
+        single call, without the configparser serializer. The layout
+        is identical to the one produced by `ConfigParser.write`.
+
+        Replaces the full content of the configfile.
+
+        Parameters
+        ----------
+        sections: dict of {str: {str: Any}}
+            dictionary of values in format {section: {option: value}}.
+        convert: bool
+            convert the values to str by StringEncoder.
+        """
+        text = io.StringIO()
+        write, to_str = text.write, StringEncoder.to_str
+        for section, options in sections.items():
+            write("[%s]\n" % section)
+            for option, value in options.items():
+                if convert:
+                    value = to_str(value)
+                write("%s = %s\n" % (option.lower(), value))
+            write("\n")
+        self._fp.write_text(text.getvalue())
+        self._hapi = None
 
     def update_config(self) -> None:
         """Re-read the configfile from specified and writes to the class."""
@@ -193,14 +275,9 @@ class RWConfig(RWFile):
             convert the resulting value to str by StringEncoder.
         """
 
-        cfg = self._read_config()
-
         match args:
             case (str() as sec, str() as opt, val):
-                if convert:
-                    val = StringEncoder.to_str(val)
-                cfg.set(sec, opt, val)
-                self.set(sec, opt, val)
+                self.set(sec, opt, val, convert=convert)
 
             case (str() as sec, dict() as options):
                 vals = {sec: {}}
@@ -208,8 +285,7 @@ class RWConfig(RWFile):
                     if convert:
                         val = StringEncoder.to_str(val)
                     vals[sec][opt] = val
-                cfg.read_dict(vals)
-                self._hapi.read_dict(vals)
+                self.hapi.read_dict(vals)
 
             case (dict() as sections,):
                 vals = {}
@@ -220,14 +296,12 @@ class RWConfig(RWFile):
                         if convert:
                             val = StringEncoder.to_str(val)
                         vals[sec][opt] = val
-                cfg.read_dict(vals)
-                self._hapi.read_dict(vals)
+                self.hapi.read_dict(vals)
 
             case _:
                 raise TypeError(f"invalid arguments {args}")
 
-        with io.open(self._fp, 'w') as cnfg_file:
-            cfg.write(cnfg_file)
+        self.apply_changes()
 
     def _read_config(self) -> configparser.ConfigParser:
         """
@@ -244,7 +318,7 @@ class RWConfig(RWFile):
 
         config = configparser.ConfigParser()
         if self._fp.exists():
-            config.read(self._fp)
+            config.read_string(self._fp.read_text())
         else:
             with io.open(self._fp, 'w') as cfg_file:
                 config.write(cfg_file)
@@ -252,4 +326,6 @@ class RWConfig(RWFile):
 
     @property
     def hapi(self) -> configparser.ConfigParser:
+        if self._hapi is None:
+            self._hapi = self._read_config()
         return self._hapi
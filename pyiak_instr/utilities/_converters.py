@@ -86,6 +86,7 @@ class StringEncoder(object):
 
     SINGLE_TYPES = int | float | str | bool | None
     ITERS = dict | list | np.ndarray | set | tuple | bytes
+    _ITERS_OR_STR = ITERS | str
 
     DELIMITER = ","
 
@@ -302,7 +303,7 @@ class StringEncoder(object):
     @classmethod
     def _to_string(cls, val: Any) -> str:
         """Convert value to string."""
-        if isinstance(val, cls.ITERS | str):
+        if isinstance(val, cls._ITERS_OR_STR):
             return cls.to_str(val)
         elif isinstance(val, Code):
             val = val.value
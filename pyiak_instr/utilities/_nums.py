@@ -4,6 +4,10 @@ import string
 __all__ = ["num_sign", "to_base", "from_base"]
 
 
+_DIGITS = string.digits + string.ascii_lowercase
+_DIGIT_VALUES = {digit: i_digit for i_digit, digit in enumerate(_DIGITS)}
+
+
 def num_sign(value: int | float, pos_zero: bool = False) -> int:
     """
     Get sign of the value.
@@ -55,7 +59,7 @@ def to_base(value: int, base: int) -> str:
 
     if value == 0:
         return "0"
-    digits = string.digits + string.ascii_lowercase
+    digits = _DIGITS
     sign = num_sign(value)
     value = abs(value)
     val_digits = []
@@ -103,11 +107,11 @@ def from_base(value: str, base: int) -> int:
         negative = False
         value = value.lower()
 
-    digits = string.digits + string.ascii_lowercase
+    digit_values = _DIGIT_VALUES
     int_value = 0
 
-    for i_digit, digit in enumerate(value[::-1]):
-        int_value += digits.index(digit) * base ** i_digit
+    for i_digit, digit in enumerate(reversed(value)):
+        int_value += digit_values[digit] * base ** i_digit
 
     if negative:
         return ~int_value + 1
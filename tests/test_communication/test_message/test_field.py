@@ -807,9 +807,9 @@ class TestFieldOperation(unittest.TestCase):
         for i_test, tf_cont in enumerate(contents):
             tf.set(tf_cont)
             for i_subtest, tf1_cont in enumerate(contents):
+                tf1.set(tf1_cont)
+                result = results_map[i_test][i_subtest]
                 with self.subTest(i_test=i_test, i_subtest=i_subtest):
-                    tf1.set(tf1_cont)
-                    result = results_map[i_test][i_subtest]
                     self.assertIs(result, tf.compare(tf1))
                     self.assertIs(result, tf == tf1.base)
                     self.assertIs(not result, tf != tf1)
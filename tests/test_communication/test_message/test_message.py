@@ -47,6 +47,8 @@ RESPONSE_CODES = {
     4: Code.WAIT
 }
 
+_BASE_INIT_ATTRS = ("mf_name", "splittable", "slice_length", "src", "dst")
+
 
 def test_common_methods(
         case: unittest.TestCase,
@@ -62,15 +64,12 @@ def test_common_methods(
 ) -> None:
     with case.subTest(test="base init"):
         res_base = res.__class__()
-        for name, ref in dict(
-            mf_name=init_mf_name,
-            splittable=init_splittable,
-            slice_length=init_slice_length,
-            src=None,
-            dst=None,
-        ).items():
-            with case.subTest(name=name):
-                case.assertEqual(ref, getattr(res_base, name))
+        case.assertEqual(
+            (init_mf_name, init_splittable, init_slice_length, None, None),
+            tuple(
+                getattr(res_base, name) for name in _BASE_INIT_ATTRS
+            )
+        )
 
     with case.subTest(test="get_instance"):
         instance = res.get_instance()
@@ -201,12 +201,7 @@ class TestMessageFormat(unittest.TestCase):
             ref_mf.write(cfg_path)
 
         with open(CFG_PATH, "r") as ref_io, open(cfg_path, "r") as res_io:
-            ref_lines, res_lines = ref_io.readlines(), res_io.readlines()
-            self.assertEqual(len(ref_lines), len(res_lines))
-
-            for line, (ref, res) in enumerate(zip(ref_lines, res_lines)):
-                with self.subTest(line=line):
-                    self.assertEqual(ref, res)
+            self.assertListEqual(ref_io.readlines(), res_io.readlines())
 
         for mf_name, ref in MF_DICT.items():
             with self.subTest(mf_name=mf_name):
@@ -215,9 +210,9 @@ class TestMessageFormat(unittest.TestCase):
 
     def test_get(self) -> None:
         test_data = [
-            (get_message(0), get_mf(0, get_ref=False).get()),
-            (get_message(1), get_mf(1, get_ref=False).get()),
-            (get_message(2), get_mf(2, get_ref=False).get()),
+            (get_message(0), MF_DICT["n0"].get()),
+            (get_message(1), MF_DICT["n1"].get()),
+            (get_message(2), MF_DICT["n2"].get()),
         ]
         for i_test, (ref, res) in enumerate(test_data):
             with self.subTest(i_test=i_test):
@@ -229,7 +224,7 @@ class TestMessageFormat(unittest.TestCase):
         compare_messages(
             self,
             get_message(1).configure(**setters),
-            get_mf(1, get_ref=False).get(data={"fmt": ">I"})
+            MF_DICT["n1"].get(data={"fmt": ">I"})
         )
 
         setters = deepcopy(SETTERS[2])
@@ -237,7 +232,7 @@ class TestMessageFormat(unittest.TestCase):
         compare_messages(
             self,
             get_message(2).configure(**setters),
-            get_mf(2, get_ref=False).get(data={"fmt": "B"})
+            MF_DICT["n2"].get(data={"fmt": "B"})
         )
 
     def test_read_exc(self):
@@ -42,8 +42,9 @@ class TestRegister(unittest.TestCase):
         )
     )
 
-    def setUp(self) -> None:
-        self.reg = Register(
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.reg = Register(
             "lol",
             "kek",
             "mf",
@@ -51,9 +52,9 @@ class TestRegister(unittest.TestCase):
             0x800,
             register_type="rw",
             description="short desc. Long desc.",
-            mf=self.MF
+            mf=cls.MF
         )
-        self.ro_reg = Register(
+        cls.ro_reg = Register(
             "lol",
             "kek",
             "mf",
@@ -62,7 +63,7 @@ class TestRegister(unittest.TestCase):
             register_type="ro",
             description="short desc. Long desc.",
         )
-        self.wo_reg = Register(
+        cls.wo_reg = Register(
             "lol",
             "kek",
             "mf",
@@ -71,7 +72,7 @@ class TestRegister(unittest.TestCase):
             register_type="wo",
             data__fmt=">f",
             description="short desc. Long desc.",
-            mf=self.MF
+            mf=cls.MF
         )
 
     def test_init(self):
@@ -170,7 +171,7 @@ class TestRegister(unittest.TestCase):
 
     def test_series(self) -> None:
         self.assertTrue(
-            np.all(self.REF_SERIES.values == self.ro_reg.series.values),
+            np.array_equal(self.REF_SERIES.values, self.ro_reg.series.values),
             f"\n{self.REF_SERIES}\n{self.ro_reg.series}"
         )
 
@@ -229,24 +230,21 @@ class TestRegisterMap(unittest.TestCase):
     @classmethod
     def setUpClass(cls) -> None:
         TEST_DIR.mkdir(parents=True, exist_ok=True)
+        cls.rm = RegisterMap(REGISTER_MAP_TABLE)
 
     @classmethod
     def tearDownClass(cls) -> None:
-        if TEST_DATA_DIR.exists():
-            shutil.rmtree(TEST_DATA_DIR)
-
-    def setUp(self) -> None:
-        self.rm = RegisterMap(REGISTER_MAP_TABLE)
+        shutil.rmtree(TEST_DATA_DIR, ignore_errors=True)
 
     def test_init(self) -> None:
         self.assertTrue(
-            np.all(self.rm.table.values == self.SORTED_DATA.values)
+            np.array_equal(self.rm.table.values, self.SORTED_DATA.values)
         )
 
     def test_validate_table_exc(self) -> None:
         with self.subTest(test="sort by format_name, address"):
             self.assertFalse(
-                np.all(self.rm.table.values == REGISTER_MAP_TABLE.values),
+                np.array_equal(self.rm.table.values, REGISTER_MAP_TABLE.values),
                 "looks like RegisterMap not sort DataFrame"
             )
 
@@ -407,7 +405,14 @@ class TestRegisterMap(unittest.TestCase):
 
     def test_write(self) -> None:
 
-        con = sqlite3.connect(self.DB_PATH)
+        con = sqlite3.connect(
+            "file:regs_test?mode=memory&cache=shared", uri=True
+        )
+        # str and Path dispatch to the same write branch, so one on-disk
+        # write covers both read-back checks.
+        self.rm.write(str(self.DB_PATH), if_exists="replace")
+        self.rm.write(con, if_exists="replace")
+
         tests = (
             ("write with str", str(self.DB_PATH)),
             ("write with Path", self.DB_PATH),
@@ -416,26 +421,25 @@ class TestRegisterMap(unittest.TestCase):
 
         for name, db in tests:
             with self.subTest(test=name):
-                self.rm.write(db, if_exists="replace")
-
                 res = RegisterMap.read(db).table.values
-                self.assertTrue(np.all(res == self.SORTED_DATA.values))
+                self.assertTrue(np.array_equal(res, self.SORTED_DATA.values))
 
         con.close()
 
     def test_get(self):
-        names = np.append(
-            REGISTER_MAP_TABLE["name"].values,
-            REGISTER_MAP_TABLE["external_name"].values
+        rows = {}
+        for _, row in REGISTER_MAP_TABLE.iterrows():
+            rows[row["name"]] = row
+            rows[row["external_name"]] = row
+
+        names = (
+            REGISTER_MAP_TABLE["name"].tolist()
+            + REGISTER_MAP_TABLE["external_name"].tolist()
         )
         for name in names:
             compare_objects(
                 self,
-                Register.from_series(
-                    REGISTER_MAP_TABLE[
-                        (REGISTER_MAP_TABLE["external_name"] == name)
-                        | (REGISTER_MAP_TABLE["name"] == name)
-                        ].iloc[0]),
+                Register.from_series(rows[name]),
                 self.rm.get(name)
             )
 
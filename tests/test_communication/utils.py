@@ -1,4 +1,5 @@
 import inspect
+from operator import attrgetter
 from unittest import TestCase
 from typing import Any
 
@@ -68,9 +69,15 @@ def validate_object(
             "attributes list is differ to reference"
         )
 
-    for attr, ref in attrs.items():
+    if not len(attrs):
+        return
+    keys = tuple(attrs)
+    values = attrgetter(*keys)(obj)
+    if len(keys) == 1:
+        values = (values,)
+    for attr, result in zip(keys, values):
         with case.subTest(class_=obj.__class__.__name__, attr=attr):
-            case.assertEqual(ref, getattr(obj, attr))
+            case.assertEqual(attrs[attr], result)
 
 
 def validate_fields(